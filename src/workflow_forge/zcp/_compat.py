@@ -0,0 +1,8 @@
+"""
+Small shims for differences between the supported python versions.
+"""
+import sys
+
+# Slotted dataclasses only exist from python 3.10 onwards. On older
+# interpreters we fall back to ordinary dataclasses.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
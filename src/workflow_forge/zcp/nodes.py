@@ -21,6 +21,7 @@ from workflow_forge.zcp.tag_converter import TagConverter
 from ..frontend.parsing.config_parsing import Config
 from workflow_forge.resources import AbstractResource
 from ..tokenizer_interface import TokenizerInterface
+from ._compat import DATACLASS_SLOTS
 
 try:
     # Most users do not need this. But if you are
@@ -35,6 +36,42 @@ except ImportError as vis_err:
     VISUALIZATION_ENABLED = False
     reason = vis_err
 
+# Built once so validation compares against ready dtype instances
+# rather than converting scalar types on every construction.
+_TOKEN_DTYPES = (np.dtype(np.int32), np.dtype(np.int64))
+_TAG_DTYPES = (np.dtype(np.bool_),)
+
+# (field name, allowed dtypes, dtype kind for messages, required) for every LZCPNode array field
+_LZCP_ARRAY_SCHEMA = (
+    ("zone_advance_tokens", _TOKEN_DTYPES, "integer", True),
+    ("jump_tokens", _TOKEN_DTYPES, "integer", False),
+    ("tags", _TAG_DTYPES, "boolean", True),
+    ("tokens", _TOKEN_DTYPES, "integer", True),
+)
+
+
+def _validate_1d_array(arr: Any, expected_dtypes: Tuple[Any, ...], dtype_kind: str, name: str) -> None:
+    """
+    Check that an LZCP field is a 1D numpy array of one of the expected dtypes.
+
+    Args:
+        arr: The value to check
+        expected_dtypes: The dtypes the array is allowed to have
+        dtype_kind: Readable name of the allowed dtypes, such as "integer"
+        name: The field name, used in the error message
+
+    Raises:
+        TypeError: If arr is not a numpy array
+        ValueError: If arr is not 1D or has the wrong dtype
+    """
+    if not isinstance(arr, np.ndarray):
+        raise TypeError(f"{name} must be a numpy array, got {type(arr)}")
+    if arr.ndim != 1:
+        raise ValueError(f"{name} must be a 1D array")
+    if arr.dtype not in expected_dtypes:
+        raise ValueError(f"{name} must have {dtype_kind} dtype")
+
+
 ## Setup the error banks
 
 class GraphLoweringError(Exception):
@@ -53,16 +90,20 @@ class GraphLoweringError(Exception):
         :param block: The block it occurred associated with
         :param sequence: The sequence it is associated with
         """
+        # The banner is only formatted in __str__. args keeps every constructor
+        # argument, so repr() still shows the context and the error pickles.
+        super().__init__(message, block, sequence)
+        self.message = message
+        self.sequence = sequence
+        self.block = block
 
+    def __str__(self) -> str:
         msg = f"""\
         An issue occurred while attempting to lower the graph
-        This occurred in sequence "{sequence}", in block "{block}"
+        This occurred in sequence "{self.sequence}", in block "{self.block}"
         The error is:
         """
-        msg= textwrap.dedent(msg) + "\n" + message
-        super().__init__(msg)
-        self.sequence = sequence
-        self.block = block
+        return textwrap.dedent(msg) + "\n" + self.message
 
 
 class GraphError(Exception):
@@ -81,16 +122,18 @@ class GraphError(Exception):
         :param block: The block it occurred associated with
         :param sequence: The sequence it is associated with
         """
+        super().__init__(message, block, sequence)
+        self.message = message
+        self.sequence = sequence
+        self.block = block
 
+    def __str__(self) -> str:
         msg = f"""\
         An issue occurred while manipulating the graph
-        This occurred in sequence "{sequence}", in block "{block}"
+        This occurred in sequence "{self.sequence}", in block "{self.block}"
         The error is:
         """
-        msg= textwrap.dedent(msg) + "\n" + message
-        super().__init__(msg)
-        self.sequence = sequence
-        self.block = block
+        return textwrap.dedent(msg) + "\n" + self.message
 
 
 @dataclass
@@ -258,7 +301,7 @@ class ZCPNode:
         return self is other
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RZCPNode:
     """
     Resolved Zone Control Protocol node from SFCS construction.
@@ -438,7 +481,7 @@ class RZCPNode:
         return self is other
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SZCPNode:
     """
     Serializable Zone Control Protocol node with fully resolved content.
@@ -799,7 +842,10 @@ class SZCPNode:
 
         Args:
             save_to_file: Optional filename to save the figure. If provided, saves to file
-                         instead of displaying. Supports .html format.
+                         instead of displaying. Names ending in .png are exported as a
+                         static image, which needs kaleido (part of the visualization
+                         extra) and suits headless environments. Anything else is
+                         saved as .html.
         """
         # Check if visualization was enabled
         if not VISUALIZATION_ENABLED:
@@ -809,11 +855,10 @@ class SZCPNode:
 
            Run:
 
-           pip install python-igraph
-           pip install plotly
-           pip install networkx
+           pip install workflow-forge[visualization]
 
-           To ensure they are all installed
+           To ensure they are all installed. The extra also installs
+           orjson, which lets plotly serialize large figures considerably faster.
            """
             msg = textwrap.dedent(msg)
             raise NotImplementedError(msg) from reason
@@ -900,6 +945,10 @@ class SZCPNode:
 
         if save_to_file is None:
             fig.show()
+        elif save_to_file.endswith('.png'):
+            # Static export, no browser involved
+            fig.write_image(save_to_file)
+            print(f"Workflow visualization saved to: {save_to_file}")
         else:
             # Save as HTML - preserves full interactivity
             if not save_to_file.endswith('.html'):
@@ -907,7 +956,8 @@ class SZCPNode:
             fig.write_html(save_to_file)
             print(f"Workflow visualization saved to: {save_to_file}")
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class LZCPNode:
     """
     Lowered Zone Control Protocol node with resolved tokens and tensor-ready data.
@@ -950,38 +1000,12 @@ class LZCPNode:
             if (self.jump_tokens is None) != (self.jump_zone is None):
                 raise ValueError("jump_tokens and jump_zone must both be present or both be None")
 
-            # Validate zone_advance_tokens
-            if not isinstance(self.zone_advance_tokens, np.ndarray):
-                raise TypeError("zone_advance_tokens must be a numpy array")
-            if self.zone_advance_tokens.ndim != 1:
-                raise ValueError("zone_advance_tokens must be a 1D array")
-            if self.zone_advance_tokens.dtype not in [np.int32, np.int64]:
-                raise ValueError("zone_advance_tokens must have integer dtype")
-
-            # Validate jump_tokens if present
-            if self.jump_tokens is not None:
-                if not isinstance(self.jump_tokens, np.ndarray):
-                    raise TypeError("jump_tokens must be a numpy array")
-                if self.jump_tokens.ndim != 1:
-                    raise ValueError("jump_tokens must be a 1D array")
-                if self.jump_tokens.dtype not in [np.int32, np.int64]:
-                    raise ValueError("jump_tokens must have integer dtype")
-
-            # Validate tags array
-            if not isinstance(self.tags, np.ndarray):
-                raise TypeError("tags must be a numpy array")
-            if self.tags.ndim != 1:
-                raise ValueError("tags must be a 1D array")
-            if self.tags.dtype != np.bool_:
-                raise ValueError("tags must have boolean dtype")
-
-            # Validate tokens array
-            if not isinstance(self.tokens, np.ndarray):
-                raise TypeError(f"tokens must be a numpy array, got {type(self.tokens)}")
-            if self.tokens.ndim != 1:
-                raise ValueError("tokens must be a 1D array")
-            if self.tokens.dtype not in [np.int32, np.int64]:
-                raise ValueError("tokens must have integer dtype")
+            # Validate the array fields
+            for name, expected_dtypes, dtype_kind, required in _LZCP_ARRAY_SCHEMA:
+                arr = getattr(self, name)
+                if arr is None and not required:
+                    continue
+                _validate_1d_array(arr, expected_dtypes, dtype_kind, name)
 
             # Validate escape patterns
             if not isinstance(self.escape_tokens, tuple):
@@ -995,6 +1019,7 @@ class LZCPNode:
         except Exception as err:
             raise GraphError(f"LZCP node validation failed",
                              sequence=self.sequence, block=self.block) from err
+
     def has_jump(self) -> bool:
         """Check if this node supports jump flow control."""
         return self.jump_tokens is not None and self.jump_zone is not None
@@ -1028,7 +1053,7 @@ class LZCPNode:
         if len(tag_names) != len(self.tags):
             raise ValueError("tag_names length must match tags array length")
 
-        return [name for name, active in zip(tag_names, self.tags) if active]
+        return [tag_names[i] for i in np.flatnonzero(self.tags).tolist()]
 
     def get_last_node(self) -> 'LZCPNode':
         """
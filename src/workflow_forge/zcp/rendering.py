@@ -8,13 +8,16 @@ Supports hover details, node coloring, proper z-ordering, and purple loopback ed
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np
 import plotly.graph_objects as go
 
+from ._compat import DATACLASS_SLOTS
+
 if TYPE_CHECKING:
     pass
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GraphNode:
     """Represents a single node in the visualization graph."""
     id: str  # Unique identifier
@@ -38,85 +41,102 @@ class GraphData:
     title: str = "Workflow Graph"
 
 
-def _create_edge_trace(connections: List[Tuple[Tuple[float, float], Tuple[float, float]]],
-                      color: str, dash: str, name: str) -> go.Scatter:
-    """Create a scatter trace for edge lines."""
-    edge_x = []
-    edge_y = []
+# Size, in pixels, of the arrowhead drawn at each edge midpoint
+_ARROW_SIZE = 10
+
+# An edge set is a pair of (source, target) node index arrays
+Edges = Tuple[np.ndarray, np.ndarray]
 
-    for start_pos, end_pos in connections:
-        edge_x.extend([start_pos[0], end_pos[0], None])
-        edge_y.extend([start_pos[1], end_pos[1], None])
 
-    return go.Scatter(
+def _node_coordinates(graph_data: GraphData) -> Tuple[np.ndarray, np.ndarray]:
+    """Gather the x and y coordinates of all nodes into arrays, in node order."""
+    count = len(graph_data.nodes)
+    xs = np.fromiter((node.x for node in graph_data.nodes), dtype=np.float64, count=count)
+    ys = np.fromiter((node.y for node in graph_data.nodes), dtype=np.float64, count=count)
+    return xs, ys
+
+
+def _create_edge_trace(xs: np.ndarray, ys: np.ndarray, edges: Edges,
+                       color: str, dash: str, name: str) -> Dict[str, Any]:
+    """
+    Create a scatter trace spec for edge lines, with an arrowhead marker at
+    each edge midpoint pointing from source to target.
+    """
+    sources, targets = edges
+    start_x, end_x = xs[sources], xs[targets]
+    start_y, end_y = ys[sources], ys[targets]
+
+    # Each edge is drawn as start, midpoint, end, then a NaN gap to break the line
+    gap = np.full(len(sources), np.nan)
+    edge_x = np.stack([start_x, (start_x + end_x) / 2, end_x, gap], axis=1).ravel()
+    edge_y = np.stack([start_y, (start_y + end_y) / 2, end_y, gap], axis=1).ravel()
+
+    # Only the midpoint gets a visible marker. angleref='previous' turns each marker
+    # along the drawn segment from the previous point, in screen space, so arrows
+    # follow their edges whatever the axis scales. scattergl does not support it.
+    marker_size = np.tile([0, _ARROW_SIZE, 0, 0], len(sources))
+
+    return dict(
+        type='scatter',
         x=edge_x,
         y=edge_y,
-        mode='lines',
+        mode='lines+markers',
         line=dict(width=2, color=color, dash=dash),
+        marker=dict(symbol='triangle-up', size=marker_size, angleref='previous', color=color),
         hoverinfo='none',
         name=name,
         showlegend=True
     )
 
 
-def _collect_connections(graph_data: GraphData) -> Tuple[
-    List[Tuple[Tuple[float, float], Tuple[float, float]]],
-    List[Tuple[Tuple[float, float], Tuple[float, float]]],
-    List[Tuple[Tuple[float, float], Tuple[float, float]]]
-]:
-    """Collect nominal, jump, and loopback connections from graph data."""
-    node_positions = {node.id: (node.x, node.y) for node in graph_data.nodes}
-
-    nominal_connections = []
-    jump_connections = []
-    loopback_connections = []
-
+def _edge_indices(graph_data: GraphData, index: Dict[str, int], attribute: str) -> Edges:
+    """Find the source and target node indices of every 'nominal' or 'jump' edge."""
+    sources = []
+    targets = []
     for node in graph_data.nodes:
-        source_pos = node_positions[node.id]
+        target = getattr(node, attribute)
+        if target and target in index:
+            sources.append(index[node.id])
+            targets.append(index[target])
+    return np.array(sources, dtype=np.intp), np.array(targets, dtype=np.intp)
 
-        # Collect nominal connections
-        if node.nominal and node.nominal in node_positions:
-            target_pos = node_positions[node.nominal]
 
-            # Check if this is a loopback (target x coordinate is lower than source)
-            if target_pos[0] < source_pos[0]:
-                loopback_connections.append((source_pos, target_pos))
-            else:
-                nominal_connections.append((source_pos, target_pos))
+def _collect_connections(graph_data: GraphData, xs: np.ndarray) -> Tuple[Edges, Edges, Edges]:
+    """Collect nominal, jump, and loopback edges from graph data."""
+    index = {node.id: i for i, node in enumerate(graph_data.nodes)}
+    nominal_sources, nominal_targets = _edge_indices(graph_data, index, 'nominal')
+    jump_sources, jump_targets = _edge_indices(graph_data, index, 'jump')
 
-        # Collect jump connections
-        if node.jump and node.jump in node_positions:
-            target_pos = node_positions[node.jump]
+    # An edge is a loopback when its target x coordinate is lower than its source
+    nominal_loops = xs[nominal_targets] < xs[nominal_sources]
+    jump_loops = xs[jump_targets] < xs[jump_sources]
 
-            # Check if this is a loopback (target x coordinate is lower than source)
-            if target_pos[0] < source_pos[0]:
-                loopback_connections.append((source_pos, target_pos))
-            else:
-                jump_connections.append((source_pos, target_pos))
+    nominal_edges = (nominal_sources[~nominal_loops], nominal_targets[~nominal_loops])
+    jump_edges = (jump_sources[~jump_loops], jump_targets[~jump_loops])
+    loopback_edges = (np.concatenate([nominal_sources[nominal_loops], jump_sources[jump_loops]]),
+                      np.concatenate([nominal_targets[nominal_loops], jump_targets[jump_loops]]))
 
-    return nominal_connections, jump_connections, loopback_connections
+    return nominal_edges, jump_edges, loopback_edges
 
 
-def _plot_edges(graph_data: GraphData) -> List[go.Scatter]:
-    """Create edge traces with proper z-ordering (edges only, no arrows)."""
-    nominal_connections, jump_connections, loopback_connections = _collect_connections(graph_data)
+def _plot_edges(graph_data: GraphData, xs: np.ndarray, ys: np.ndarray) -> List[Dict[str, Any]]:
+    """Create edge traces with proper z-ordering (edges and their arrowheads)."""
+    nominal_edges, jump_edges, loopback_edges = _collect_connections(graph_data, xs)
 
     traces = []
 
     # Create edge traces
-    nominal_edge_trace = _create_edge_trace(nominal_connections, 'blue', 'solid', 'Nominal Flow')
-    jump_edge_trace = _create_edge_trace(jump_connections, 'red', 'dash', 'Jump Flow')
-    loopback_edge_trace = _create_edge_trace(loopback_connections, 'purple', 'dot', 'Loopback Flow')
+    nominal_edge_trace = _create_edge_trace(xs, ys, nominal_edges, 'blue', 'solid', 'Nominal Flow')
+    jump_edge_trace = _create_edge_trace(xs, ys, jump_edges, 'red', 'dash', 'Jump Flow')
+    loopback_edge_trace = _create_edge_trace(xs, ys, loopback_edges, 'purple', 'dot', 'Loopback Flow')
 
     traces.extend([nominal_edge_trace, jump_edge_trace, loopback_edge_trace])
 
     return traces
 
 
-def _plot_nodes(graph_data: GraphData) -> go.Scatter:
-    """Create scatter trace for all nodes in the graph (top layer)."""
-    x_coords = [node.x for node in graph_data.nodes]
-    y_coords = [node.y for node in graph_data.nodes]
+def _plot_nodes(graph_data: GraphData, xs: np.ndarray, ys: np.ndarray) -> Dict[str, Any]:
+    """Create scatter trace spec for all nodes in the graph (top layer)."""
     colors = [node.color for node in graph_data.nodes]
     names = [node.name for node in graph_data.nodes]
 
@@ -137,9 +157,10 @@ def _plot_nodes(graph_data: GraphData) -> go.Scatter:
 
         hover_texts.append("<br>".join(hover_lines))
 
-    return go.Scatter(
-        x=x_coords,
-        y=y_coords,
+    return dict(
+        type='scattergl',
+        x=xs,
+        y=ys,
         mode='markers+text',
         marker=dict(
             size=25,
@@ -160,7 +181,7 @@ def create_plotly_graph(graph_data: GraphData) -> go.Figure:
     Create interactive Plotly graph from GraphData with proper z-ordering.
 
     Z-order (bottom to top):
-    1. Edge lines (blue=nominal, red=jump, purple=loopback)
+    1. Edge lines with midpoint arrowheads (blue=nominal, red=jump, purple=loopback)
     2. Nodes
 
     Args:
@@ -170,18 +191,16 @@ def create_plotly_graph(graph_data: GraphData) -> go.Figure:
         Plotly Figure ready for display
     """
     # Create traces in proper z-order
-    edge_traces = _plot_edges(graph_data)  # Bottom layer
-    node_trace = _plot_nodes(graph_data)  # Top layer
+    xs, ys = _node_coordinates(graph_data)
+    edge_traces = _plot_edges(graph_data, xs, ys)  # Bottom layer
+    node_trace = _plot_nodes(graph_data, xs, ys)  # Top layer
 
     # Combine traces in correct order (edges first, nodes last)
     all_traces = edge_traces + [node_trace]
 
-    # Create figure
-    fig = go.Figure(data=all_traces)
-
     # Configure layout
-    fig.update_layout(
-        title=graph_data.title,
+    layout = dict(
+        title=dict(text=graph_data.title),
         showlegend=True,
         hovermode='closest',
         margin=dict(b=20, l=5, r=5, t=40),
@@ -200,4 +219,8 @@ def create_plotly_graph(graph_data: GraphData) -> go.Figure:
         plot_bgcolor='white'
     )
 
+    # Traces and layout are plain dicts built from fixed literals, so
+    # plotly's per-property validation can be skipped when wrapping them.
+    fig = go.Figure(data=all_traces, layout=layout, _validate=False)
+
     return fig
\ No newline at end of file
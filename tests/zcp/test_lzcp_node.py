@@ -10,53 +10,75 @@ Tests cover:
 6. Error handling and exception propagation
 """
 
+import copy
 import unittest
 import numpy as np
-from unittest.mock import Mock
 from typing import Dict, Any, Optional, Tuple
 
 # Import the modules under test
 from workflow_forge.zcp.nodes import LZCPNode, GraphError
 
+# Default escape tokens are shared by every node, so they are frozen
+_ESCAPE_START = np.array([100, 101], dtype=np.int32)
+_ESCAPE_START.setflags(write=False)
+_ESCAPE_END = np.array([102, 103], dtype=np.int32)
+_ESCAPE_END.setflags(write=False)
+_DEFAULT_ESCAPE_TOKENS = (_ESCAPE_START, _ESCAPE_END)
 
-class BaseLZCPNodeTest(unittest.TestCase):
-    """Base test class with common setup and helper methods."""
-
-    def setUp(self):
-        """Set up common test fixtures."""
-        pass  # No complex mocks needed for LZCPNode
 
-    def get_valid_tokens(self, tokens: Optional[list] = None) -> np.ndarray:
+class BaseLZCPNodeTest(unittest.TestCase):
+    """
+    Base test class with common setup and helper methods.
+
+    The template node's token, zone advance and tag arrays are marked
+    read-only, and the default escape tokens are a module constant, so
+    clones can share those arrays without one test affecting another.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a validated template node that clone_node copies from."""
+        cls._template_node = LZCPNode(**cls.get_valid_node_data())
+        for array in (cls._template_node.tokens,
+                      cls._template_node.zone_advance_tokens,
+                      cls._template_node.tags):
+            array.setflags(write=False)
+
+    @staticmethod
+    def get_valid_tokens(tokens: Optional[list] = None) -> np.ndarray:
         """Create valid tokens array with proper dtype."""
         if tokens is None:
             tokens = [1, 2, 3]
         return np.array(tokens, dtype=np.int32)
 
-    def get_valid_zone_advance_tokens(self, tokens: Optional[list] = None) -> np.ndarray:
+    @staticmethod
+    def get_valid_zone_advance_tokens(tokens: Optional[list] = None) -> np.ndarray:
         """Create valid zone_advance_tokens array with proper dtype."""
         if tokens is None:
             tokens = [10]
         return np.array(tokens, dtype=np.int32)
 
-    def get_valid_jump_tokens(self, tokens: Optional[list] = None) -> np.ndarray:
+    @staticmethod
+    def get_valid_jump_tokens(tokens: Optional[list] = None) -> np.ndarray:
         """Create valid jump_tokens array with proper dtype."""
         if tokens is None:
             tokens = [20, 21]
         return np.array(tokens, dtype=np.int32)
 
-    def get_valid_tags(self, tags: Optional[list] = None) -> np.ndarray:
+    @staticmethod
+    def get_valid_tags(tags: Optional[list] = None) -> np.ndarray:
         """Create valid tags array with proper dtype."""
         if tags is None:
             tags = [True, False]
         return np.array(tags, dtype=np.bool_)
 
-    def get_valid_escape_tokens(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Create valid escape_tokens tuple with proper dtypes."""
-        escape_start = np.array([100, 101], dtype=np.int32)
-        escape_end = np.array([102, 103], dtype=np.int32)
-        return (escape_start, escape_end)
+    @staticmethod
+    def get_valid_escape_tokens() -> Tuple[np.ndarray, np.ndarray]:
+        """Return the shared, read-only escape_tokens tuple."""
+        return _DEFAULT_ESCAPE_TOKENS
 
-    def get_valid_node_data(self, **overrides) -> Dict[str, Any]:
+    @classmethod
+    def get_valid_node_data(cls, **overrides) -> Dict[str, Any]:
         """
         Return valid node data for testing, with optional field overrides.
 
@@ -69,10 +91,10 @@ class BaseLZCPNodeTest(unittest.TestCase):
         base_data = {
             'sequence': 'test_sequence',
             'block': 0,
-            'tokens': self.get_valid_tokens(),
-            'zone_advance_tokens': self.get_valid_zone_advance_tokens(),
-            'escape_tokens': self.get_valid_escape_tokens(),
-            'tags': self.get_valid_tags(),
+            'tokens': cls.get_valid_tokens(),
+            'zone_advance_tokens': cls.get_valid_zone_advance_tokens(),
+            'escape_tokens': cls.get_valid_escape_tokens(),
+            'tags': cls.get_valid_tags(),
             'timeout': 1000,
             'input': False,
             'output': False,
@@ -96,6 +118,23 @@ class BaseLZCPNodeTest(unittest.TestCase):
         """
         return LZCPNode(**self.get_valid_node_data(**overrides))
 
+    def clone_node(self, **overrides) -> LZCPNode:
+        """
+        Shallow-copy the template node, sharing its read-only arrays, and
+        assign the given fields. The array checks in __post_init__ do not run
+        on the copy, so validation tests must use create_node instead.
+
+        Args:
+            **overrides: Fields to set on the copy
+
+        Returns:
+            The cloned LZCPNode
+        """
+        node = copy.copy(self._template_node)
+        for name, value in overrides.items():
+            setattr(node, name, value)
+        return node
+
     def create_node_chain(self, length: int, **base_overrides) -> LZCPNode:
         """
         Create a chain of linked LZCPNodes.
@@ -161,7 +200,30 @@ class BaseLZCPNodeTest(unittest.TestCase):
 
     def assert_arrays_equal(self, actual: np.ndarray, expected: np.ndarray, msg: str = None):
         """Helper to assert numpy arrays are equal with better error messages."""
-        np.testing.assert_array_equal(actual, expected, err_msg=msg)
+        # np.array_equal is cheap; only build numpy's detailed diff on mismatch
+        if not np.array_equal(actual, expected):
+            np.testing.assert_array_equal(actual, expected, err_msg=msg)
+
+    def assert_node_matches(self, node: LZCPNode, expected: Dict[str, Any]):
+        """
+        Assert node fields match the expected values in a single pass.
+
+        Args:
+            node: The node to check
+            expected: Mapping of field name to expected value. Arrays are compared
+                by value, tuples of arrays elementwise, everything else by equality.
+        """
+        for name, expected_value in expected.items():
+            actual = getattr(node, name)
+            if isinstance(expected_value, np.ndarray):
+                self.assert_arrays_equal(actual, expected_value, msg=name)
+            elif isinstance(expected_value, tuple):
+                self.assertIsInstance(actual, tuple, name)
+                self.assertEqual(len(actual), len(expected_value), name)
+                for actual_item, expected_item in zip(actual, expected_value):
+                    self.assert_arrays_equal(actual_item, expected_item, msg=name)
+            else:
+                self.assertEqual(actual, expected_value, name)
 
     def assert_array_properties(self, array: np.ndarray, expected_dtype: np.dtype,
                               expected_ndim: int, array_name: str = "array"):
@@ -187,26 +249,21 @@ class TestLZCPNodeConstruction(BaseLZCPNodeTest):
         node_data = self.get_valid_node_data()
         node = LZCPNode(**node_data)
 
-        self.assertEqual(node.sequence, 'test_sequence')
-        self.assertEqual(node.block, 0)
-        self.assertEqual(node.timeout, 1000)
-        self.assertFalse(node.input)
-        self.assertFalse(node.output)
-        self.assertIsNone(node.next_zone)
-        self.assertIsNone(node.jump_tokens)
-        self.assertIsNone(node.jump_zone)
-        self.assertIsNone(node.tool_callback)
-
-        # Verify arrays with proper assertions
-        self.assert_arrays_equal(node.tokens, np.array([1, 2, 3]))
-        self.assert_arrays_equal(node.zone_advance_tokens, np.array([10]))
-        self.assert_arrays_equal(node.tags, np.array([True, False]))
-
-        # Verify escape_tokens tuple
-        self.assertIsInstance(node.escape_tokens, tuple)
-        self.assertEqual(len(node.escape_tokens), 2)
-        self.assert_arrays_equal(node.escape_tokens[0], np.array([100, 101]))
-        self.assert_arrays_equal(node.escape_tokens[1], np.array([102, 103]))
+        self.assert_node_matches(node, {
+            'sequence': 'test_sequence',
+            'block': 0,
+            'timeout': 1000,
+            'input': False,
+            'output': False,
+            'next_zone': None,
+            'jump_tokens': None,
+            'jump_zone': None,
+            'tool_callback': None,
+            'tokens': np.array([1, 2, 3]),
+            'zone_advance_tokens': np.array([10]),
+            'tags': np.array([True, False]),
+            'escape_tokens': (np.array([100, 101]), np.array([102, 103])),
+        })
 
     def test_node_with_jump_control(self):
         """Test creating node with jump flow control."""
@@ -220,18 +277,20 @@ class TestLZCPNodeConstruction(BaseLZCPNodeTest):
     def test_input_output_flags(self):
         """Test nodes with input/output flags set."""
         # Test input node
-        input_node = self.create_node(input=True)
+        input_node = self.clone_node(input=True)
         self.assertTrue(input_node.input)
 
         # Test output node
-        output_node = self.create_node(output=True)
+        output_node = self.clone_node(output=True)
         self.assertTrue(output_node.output)
 
     def test_tool_callback_assignment(self):
         """Test node with tool callback."""
-        mock_tool_callback = Mock()
-        tool_node = self.create_node(tool_callback=mock_tool_callback)
-        self.assertEqual(tool_node.tool_callback, mock_tool_callback)
+        def tool_callback(tokens: np.ndarray) -> np.ndarray:
+            return tokens
+
+        tool_node = self.clone_node(tool_callback=tool_callback)
+        self.assertIs(tool_node.tool_callback, tool_callback)
 
     def test_escape_tokens_assignment(self):
         """Test that escape_tokens field is properly assigned."""
@@ -296,87 +355,64 @@ class TestLZCPNodeValidation(BaseLZCPNodeTest):
 
     def test_zone_advance_tokens_validation(self):
         """Test validation of zone_advance_tokens array."""
-        # Test wrong type
-        with self.assertRaises(GraphError):
-            self.create_node(
-                sequence='validation_test',
-                zone_advance_tokens=[10, 20]  # List instead of numpy array
-            )
-
-        # Test wrong dimensions
-        with self.assertRaises(GraphError):
-            self.create_node(
-                sequence='validation_test',
-                zone_advance_tokens=np.array([[10], [20]], dtype=np.int32)  # 2D
-            )
-
-        # Test wrong dtype
-        with self.assertRaises(GraphError):
-            self.create_node(
-                sequence='validation_test',
-                zone_advance_tokens=np.array([10.5], dtype=np.float32)  # Float
-            )
+        bad_inputs = {
+            'wrong_type': [10, 20],  # List instead of numpy array
+            'wrong_ndim': np.array([[10], [20]], dtype=np.int32),  # 2D
+            'wrong_dtype': np.array([10.5], dtype=np.float32),  # Float
+        }
+        for case, value in bad_inputs.items():
+            with self.subTest(case=case):
+                with self.assertRaises(GraphError):
+                    self.create_node(sequence='validation_test', zone_advance_tokens=value)
 
     def test_jump_tokens_validation(self):
         """Test validation of jump_tokens array when present."""
         target_node = self.create_node()
-
-        # Test wrong type
-        with self.assertRaises(GraphError):
-            self.create_node(
-                jump_tokens=[20, 21],  # List instead of numpy array
-                jump_zone=target_node
-            )
-
-        # Test wrong dimensions
-        with self.assertRaises(GraphError):
-            self.create_node(
-                jump_tokens=np.array([[20], [21]], dtype=np.int32),  # 2D
-                jump_zone=target_node
-            )
-
-        # Test wrong dtype
-        with self.assertRaises(GraphError):
-            self.create_node(
-                jump_tokens=np.array([20.5], dtype=np.float32),  # Float
-                jump_zone=target_node
-            )
+        bad_inputs = {
+            'wrong_type': [20, 21],  # List instead of numpy array
+            'wrong_ndim': np.array([[20], [21]], dtype=np.int32),  # 2D
+            'wrong_dtype': np.array([20.5], dtype=np.float32),  # Float
+        }
+        for case, value in bad_inputs.items():
+            with self.subTest(case=case):
+                with self.assertRaises(GraphError):
+                    self.create_node(jump_tokens=value, jump_zone=target_node)
 
     def test_tags_array_validation(self):
         """Test validation of tags array."""
-        # Test wrong type
-        with self.assertRaises(GraphError):
-            self.create_node(tags=[True, False])  # List instead of numpy array
-
-        # Test wrong dimensions
-        with self.assertRaises(GraphError):
-            self.create_node(
-                tags=np.array([[True], [False]], dtype=np.bool_)  # 2D
-            )
-
-        # Test wrong dtype
-        with self.assertRaises(GraphError):
-            self.create_node(
-                tags=np.array([1, 0], dtype=np.int32)  # Integer
-            )
+        bad_inputs = {
+            'wrong_type': [True, False],  # List instead of numpy array
+            'wrong_ndim': np.array([[True], [False]], dtype=np.bool_),  # 2D
+            'wrong_dtype': np.array([1, 0], dtype=np.int32),  # Integer
+        }
+        for case, value in bad_inputs.items():
+            with self.subTest(case=case):
+                with self.assertRaises(GraphError):
+                    self.create_node(tags=value)
 
     def test_tokens_array_validation(self):
         """Test validation of tokens array."""
-        # Test wrong type
-        with self.assertRaises(GraphError):
-            self.create_node(tokens=[1, 2, 3])  # List instead of numpy array
-
-        # Test wrong dimensions
-        with self.assertRaises(GraphError):
-            self.create_node(
-                tokens=np.array([[1], [2], [3]], dtype=np.int32)  # 2D
-            )
-
-        # Test wrong dtype
-        with self.assertRaises(GraphError):
-            self.create_node(
-                tokens=np.array([1.5, 2.5, 3.5], dtype=np.float32)  # Float
-            )
+        bad_inputs = {
+            'wrong_type': [1, 2, 3],  # List instead of numpy array
+            'wrong_ndim': np.array([[1], [2], [3]], dtype=np.int32),  # 2D
+            'wrong_dtype': np.array([1.5, 2.5, 3.5], dtype=np.float32),  # Float
+        }
+        for case, value in bad_inputs.items():
+            with self.subTest(case=case):
+                with self.assertRaises(GraphError):
+                    self.create_node(tokens=value)
+
+    def test_dtype_error_messages(self):
+        """Test dtype failures name the expected kind of dtype readably."""
+        cases = {
+            'tokens': (np.array([1.5], dtype=np.float32), "tokens must have integer dtype"),
+            'tags': (np.array([1, 0], dtype=np.int32), "tags must have boolean dtype"),
+        }
+        for field, (value, message) in cases.items():
+            with self.subTest(field=field):
+                with self.assertRaises(GraphError) as context:
+                    self.create_node(**{field: value})
+                self.assertEqual(str(context.exception.__cause__), message)
 
     def test_escape_tokens_validation(self):
         """Test validation of escape_tokens tuple and arrays."""
@@ -560,6 +596,17 @@ class TestLZCPNodeErrorHandling(BaseLZCPNodeTest):
 
         self.assert_graph_error_context(context, "error_sequence", 5)
 
+    def test_validation_error_message(self):
+        """Test that the formatted error message carries the context and detail."""
+        with self.assertRaises(GraphError) as context:
+            self.create_node(sequence='error_sequence', block=5, tokens=[1, 2, 3])
+
+        message = str(context.exception)
+        self.assertIn('sequence "error_sequence"', message)
+        self.assertIn('block "5"', message)
+        self.assertIn("LZCP node validation failed", message)
+        self.assertEqual(context.exception.args, ("LZCP node validation failed", 5, 'error_sequence'))
+
     def test_exception_chaining_preserved(self):
         """Test that original exceptions are preserved in the chain."""
         # This test verifies that the GraphError wraps the original TypeError
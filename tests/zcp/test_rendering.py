@@ -5,11 +5,12 @@ Creates different node layouts that you can view to verify the visualization wor
 Run these to see actual graphs and inspect them visually.
 """
 
+import os
 import unittest
 from workflow_forge.zcp.rendering import GraphNode, GraphData, create_plotly_graph
 
-# Set to True to display graphs during testing
-SHOW_GRAPHS = True
+# Set the WF_SHOW_GRAPHS=1 environment variable to display graphs during testing
+SHOW_GRAPHS = os.environ.get("WF_SHOW_GRAPHS") == "1"
 
 
 class VisualTestCases(unittest.TestCase):
@@ -195,6 +196,60 @@ class VisualTestCases(unittest.TestCase):
             fig.show()
 
 
+class TestEdgeBatching(unittest.TestCase):
+    """Edges must be batched per kind, not drawn as one trace per edge."""
+
+    def test_trace_count_independent_of_edge_count(self):
+        """Any graph renders as nominal, jump and loopback edge traces plus one node trace."""
+        nodes = [GraphNode(str(i), str(i), "blue", i, 0, nominal=str(i + 1), jump="0")
+                 for i in range(20)]
+        nodes.append(GraphNode("20", "20", "red", 20, 0))
+
+        fig = create_plotly_graph(GraphData(nodes, "Many Edges"))
+
+        self.assertEqual([trace.name for trace in fig.data],
+                         ['Nominal Flow', 'Jump Flow', 'Loopback Flow', 'Nodes'])
+        # Each of the 20 nominal edges contributes a start, midpoint, end and gap point
+        self.assertEqual(len(fig.data[0].x), 4 * 20)
+
+    def test_arrowheads_point_along_edges(self):
+        """Arrowheads sit at edge midpoints, turned along the segment drawn from the source."""
+        nodes = [
+            GraphNode("A", "A", "green", 0, 0, nominal="B", jump="C"),
+            GraphNode("B", "B", "blue", 2, 0),
+            GraphNode("C", "C", "red", 0, -2),
+        ]
+
+        fig = create_plotly_graph(GraphData(nodes, "Arrows"))
+        nominal, jump = fig.data[0], fig.data[1]
+
+        self.assertEqual((nominal.x[1], nominal.y[1]), (1.0, 0.0))
+        self.assertEqual(list(nominal.marker.size), [0, 10, 0, 0])
+        for trace in (nominal, jump):
+            self.assertEqual(trace.type, 'scatter')
+            self.assertEqual(trace.marker.angleref, 'previous')
+
+    def test_diagonal_arrowheads_match_drawn_direction(self):
+        """Diagonal arrowheads follow the drawn line without forcing equal axis scales."""
+        nodes = [
+            GraphNode("A", "A", "green", 11, 2, nominal="B"),
+            GraphNode("B", "B", "blue", 13, 3),
+        ]
+
+        fig = create_plotly_graph(GraphData(nodes, "Diagonal"))
+        nominal = fig.data[0]
+
+        # The layout keeps free axis scales, so long workflows are not squashed
+        self.assertIsNone(fig.layout.yaxis.scaleanchor)
+
+        # The arrowhead is oriented from the point before it, which is the source,
+        # and sits on the straight segment on to the target
+        self.assertEqual(nominal.marker.angleref, 'previous')
+        self.assertEqual((nominal.x[0], nominal.y[0]), (11.0, 2.0))
+        self.assertEqual((nominal.x[1], nominal.y[1]), (12.0, 2.5))
+        self.assertEqual((nominal.x[2], nominal.y[2]), (13.0, 3.0))
+
+
 def run_visual_tests():
     """Run all visual tests and optionally display them."""
     print("WORKFLOW FORGE VISUALIZATION - VISUAL TEST SUITE")
@@ -204,7 +259,7 @@ def run_visual_tests():
     if SHOW_GRAPHS:
         print("Graphs will be displayed in your browser.")
     else:
-        print("Set SHOW_GRAPHS = True to display graphs.")
+        print("Set WF_SHOW_GRAPHS=1 to display graphs.")
     print()
 
     suite = unittest.TestLoader().loadTestsFromTestCase(VisualTestCases)
@@ -216,7 +271,7 @@ def run_visual_tests():
     print(f"\n✓ Created {result.testsRun} different graph layouts")
     print("✓ All graphs generated without errors")
     if not SHOW_GRAPHS:
-        print("\nTo view the graphs: Set SHOW_GRAPHS = True and re-run")
+        print("\nTo view the graphs: Set WF_SHOW_GRAPHS=1 and re-run")
 
     return result.wasSuccessful()
 
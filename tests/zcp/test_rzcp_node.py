@@ -11,23 +11,89 @@ Tests cover:
 7. Three-tier resource system integration
 """
 
+import copy
 import unittest
+from types import MappingProxyType
 from unittest.mock import Mock
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 # Import the modules under test
 from workflow_forge.zcp.nodes import RZCPNode, SZCPNode, GraphLoweringError, GraphError
 from workflow_forge.resources import AbstractResource
 
+# Constructor arguments shared by every test node, minus the sampling
+# callback, which is created per test. Frozen so no test can mutate it;
+# tags is a tuple here and is copied into a fresh list for each node.
+_BASE_NODE_DATA = MappingProxyType({
+    'sequence': 'test_sequence',
+    'block': 0,
+    'zone_advance_str': '[Answer]',
+    'escape_strs': ('[Escape]', '[EndEscape]'),
+    'tags': ('Training',),
+    'timeout': 1000,
+    'input': False,
+    'output': False,
+    'next_zone': None,
+    'jump_advance_str': None,
+    'jump_zone': None,
+    'tool_name': None
+})
+
+# Opaque resource values, looked up by name. Nodes only hand them on to the
+# sampling callback, so these spec mocks are built once and never called.
+_RESOURCES = MappingProxyType({
+    name: Mock(spec=AbstractResource)
+    for name in ('dynamic', 'resource1', 'resource2', 'resource3', 'shared_resource',
+                 'test', 'topology_resource', 'failing_resource')
+})
+
+
+def _make_node_data(sampling_callback, **overrides) -> Dict[str, Any]:
+    """Build RZCPNode constructor arguments from the base data, with a fresh tags list."""
+    return {
+        **_BASE_NODE_DATA,
+        'tags': list(_BASE_NODE_DATA['tags']),
+        'sampling_callback': sampling_callback,
+        **overrides
+    }
+
+
+class FakeSamplingCallback:
+    """
+    Lightweight stand-in for a sampling callback. Returns fixed text, or
+    raises a given error, and records the resources it was called with.
+    """
+
+    def __init__(self, text: str = "", error: Optional[Exception] = None):
+        self.text = text
+        self.error = error
+        self.calls = []
+
+    def __call__(self, resources: Dict[str, AbstractResource]) -> str:
+        self.calls.append(resources)
+        if self.error is not None:
+            raise self.error
+        return self.text
+
 
 class BaseRZCPNodeTest(unittest.TestCase):
-    """Base test class with common setup and helper methods."""
+    """
+    Base test class with common setup and helper methods.
+
+    The module-level base node data is a frozen mapping and the template
+    node is never modified. Each test gets its own sampling callback, and
+    every node built from either source gets its own tags list.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a validated template node that clone_node copies from."""
+        cls._template_node = RZCPNode(**_make_node_data(None))
 
     def setUp(self):
         """Set up common test fixtures."""
-        # Create mock sampling callback that accepts dynamic resources
-        self.mock_sampling_callback = Mock()
-        self.mock_sampling_callback.return_value = "resolved text"
+        # Create sampling callback that accepts dynamic resources
+        self.sampling_callback = FakeSamplingCallback("resolved text")
 
     def get_valid_node_data(self, **overrides) -> Dict[str, Any]:
         """
@@ -39,23 +105,7 @@ class BaseRZCPNodeTest(unittest.TestCase):
         Returns:
             Dictionary of valid RZCPNode constructor arguments
         """
-        base_data = {
-            'sequence': 'test_sequence',
-            'block': 0,
-            'zone_advance_str': '[Answer]',
-            'escape_strs': ('[Escape]', '[EndEscape]'),
-            'tags': ['Training'],
-            'timeout': 1000,
-            'sampling_callback': self.mock_sampling_callback,
-            'input': False,
-            'output': False,
-            'next_zone': None,
-            'jump_advance_str': None,
-            'jump_zone': None,
-            'tool_name': None
-        }
-        base_data.update(overrides)
-        return base_data
+        return _make_node_data(**{'sampling_callback': self.sampling_callback, **overrides})
 
     def create_node(self, **overrides) -> RZCPNode:
         """
@@ -69,6 +119,25 @@ class BaseRZCPNodeTest(unittest.TestCase):
         """
         return RZCPNode(**self.get_valid_node_data(**overrides))
 
+    def clone_node(self, **overrides) -> RZCPNode:
+        """
+        Copy the template node with a fresh tags list and this test's
+        sampling callback, then assign the given fields. The jump
+        consistency check in __post_init__ does not run on the copy.
+
+        Args:
+            **overrides: Fields to set on the copy
+
+        Returns:
+            The cloned RZCPNode, using this test's sampling callback
+        """
+        node = copy.copy(self._template_node)
+        node.tags = list(node.tags)
+        node.sampling_callback = self.sampling_callback
+        for name, value in overrides.items():
+            setattr(node, name, value)
+        return node
+
     def create_node_chain(self, length: int, **base_overrides) -> RZCPNode:
         """
         Create a chain of linked RZCPNodes.
@@ -83,21 +152,19 @@ class BaseRZCPNodeTest(unittest.TestCase):
         if length < 1:
             raise ValueError("Chain length must be at least 1")
 
-        # Create nodes
-        nodes = []
-        for i in range(length):
-            # Create separate mock for each node to avoid shared state
-            mock_callback = Mock(return_value=f"resolved text {i}")
-            node_overrides = base_overrides.copy()
-            node_overrides.update({'block': i, 'sampling_callback': mock_callback})
-            node = self.create_node(**node_overrides)
-            nodes.append(node)
-
-        # Link them
-        for i in range(length - 1):
-            nodes[i].next_zone = nodes[i + 1]
+        # Build from the tail so each node is linked as it is created
+        node = None
+        for i in reversed(range(length)):
+            # Create separate callback for each node to avoid shared state
+            callback = FakeSamplingCallback(f"resolved text {i}")
+            node = self.clone_node(**{
+                **base_overrides,
+                'block': i,
+                'sampling_callback': callback,
+                'next_zone': node
+            })
 
-        return nodes[0]
+        return node
 
     def create_jump_node(self, target_node: RZCPNode, jump_str: str = '[Jump]', **overrides) -> RZCPNode:
         """
@@ -111,12 +178,7 @@ class BaseRZCPNodeTest(unittest.TestCase):
         Returns:
             RZCPNode with jump capability configured
         """
-        jump_overrides = {
-            'jump_advance_str': jump_str,
-            'jump_zone': target_node
-        }
-        jump_overrides.update(overrides)
-        return self.create_node(**jump_overrides)
+        return self.create_node(jump_advance_str=jump_str, jump_zone=target_node, **overrides)
 
     def assert_szcp_node_properties(self, szcp_node: SZCPNode, expected_sequence: str,
                                   expected_block: int, expected_timeout: int = 1000):
@@ -130,10 +192,41 @@ class BaseRZCPNodeTest(unittest.TestCase):
             expected_timeout: Expected timeout value
         """
         self.assertIsInstance(szcp_node, SZCPNode)
-        self.assertEqual(szcp_node.sequence, expected_sequence)
-        self.assertEqual(szcp_node.block, expected_block)
-        self.assertEqual(szcp_node.timeout, expected_timeout)
-        self.assertEqual(szcp_node.escape_strs, ('[Escape]', '[EndEscape]'))
+        self.assertEqual(
+            {
+                'sequence': szcp_node.sequence,
+                'block': szcp_node.block,
+                'timeout': szcp_node.timeout,
+                'escape_strs': szcp_node.escape_strs
+            },
+            {
+                'sequence': expected_sequence,
+                'block': expected_block,
+                'timeout': expected_timeout,
+                'escape_strs': _BASE_NODE_DATA['escape_strs']
+            }
+        )
+
+    def assert_szcp_chain(self, head: SZCPNode, expected_blocks: List[int]) -> List[SZCPNode]:
+        """
+        Walk next_zone links from head, asserting each hop is an SZCPNode
+        with the expected block.
+
+        Args:
+            head: The lowered node to start from
+            expected_blocks: Expected block numbers along the nominal path
+
+        Returns:
+            The visited nodes, in path order
+        """
+        nodes = []
+        node = head
+        for block in expected_blocks:
+            self.assertIs(type(node), SZCPNode)
+            self.assertEqual(node.block, block)
+            nodes.append(node)
+            node = node.next_zone
+        return nodes
 
     def assert_graph_error_context(self, context_manager, expected_sequence: str, expected_block: int):
         """
@@ -144,8 +237,8 @@ class BaseRZCPNodeTest(unittest.TestCase):
             expected_sequence: Expected sequence name in error
             expected_block: Expected block number in error
         """
-        self.assertEqual(context_manager.exception.sequence, expected_sequence)
-        self.assertEqual(context_manager.exception.block, expected_block)
+        error = context_manager.exception
+        self.assertEqual((error.sequence, error.block), (expected_sequence, expected_block))
 
 
 class TestRZCPNodeConstruction(BaseRZCPNodeTest):
@@ -168,110 +261,76 @@ class TestRZCPNodeConstruction(BaseRZCPNodeTest):
         self.assertIsNone(node.jump_advance_str)
         self.assertIsNone(node.jump_zone)
         self.assertIsNone(node.tool_name)
-        self.assertEqual(node.sampling_callback, self.mock_sampling_callback)
+        self.assertIs(node.sampling_callback, self.sampling_callback)
 
     def test_input_output_flags(self):
         """Test nodes with input/output flags set."""
         # Test input node
-        input_node = self.create_node(input=True)
+        input_node = self.clone_node(input=True)
         self.assertTrue(input_node.input)
 
         # Test output node
-        output_node = self.create_node(output=True)
+        output_node = self.clone_node(output=True)
         self.assertTrue(output_node.output)
 
     def test_tool_name_assignment(self):
         """Test node with tool name."""
-        tool_node = self.create_node(tool_name='calculator')
+        tool_node = self.clone_node(tool_name='calculator')
         self.assertEqual(tool_node.tool_name, 'calculator')
 
-    def test_post_init_jump_consistency_both_present(self):
-        """Test __post_init__ validation when both jump_advance_str and jump_zone are present."""
-        target_node = self.create_node()
-        jump_node = self.create_jump_node(target_node)
-
-        # Should not raise exception
-        self.assertIsNotNone(jump_node.jump_advance_str)
-        self.assertIsNotNone(jump_node.jump_zone)
-
-    def test_post_init_jump_consistency_mismatch_str_only(self):
-        """Test __post_init__ validation fails when only jump_advance_str is present."""
-        with self.assertRaises(GraphError) as context:
-            self.create_node(jump_advance_str='[Jump]')  # jump_zone remains None
-
-        self.assert_graph_error_context(context, 'test_sequence', 0)
-
-    def test_post_init_jump_consistency_mismatch_zone_only(self):
-        """Test __post_init__ validation fails when only jump_zone is present."""
-        target_node = self.create_node()
-
-        with self.assertRaises(GraphError) as context:
-            self.create_node(jump_zone=target_node)  # jump_advance_str remains None
-
-        self.assert_graph_error_context(context, 'test_sequence', 0)
+    def test_post_init_jump_consistency(self):
+        """Test __post_init__ accepts jump fields only when both or neither are present."""
+        # __post_init__ only checks for None, so any object serves as a target
+        target_node = object()
+        cases = [
+            ('neither', {}, False),
+            ('both', {'jump_advance_str': '[Jump]', 'jump_zone': target_node}, False),
+            ('str_only', {'jump_advance_str': '[Jump]'}, True),
+            ('zone_only', {'jump_zone': target_node}, True),
+        ]
+        for name, overrides, raises in cases:
+            with self.subTest(case=name):
+                if raises:
+                    with self.assertRaises(GraphError) as context:
+                        self.create_node(**overrides)
+                    self.assert_graph_error_context(context, 'test_sequence', 0)
+                else:
+                    node = self.create_node(**overrides)
+                    self.assertEqual(node.jump_advance_str, overrides.get('jump_advance_str'))
+                    self.assertIs(node.jump_zone, overrides.get('jump_zone'))
 
 
 class TestRZCPNodeStateQueries(BaseRZCPNodeTest):
     """Test state query methods."""
 
-    def test_has_jump_false(self):
-        """Test has_jump returns False when no jump capability."""
-        node = self.create_node()
-        self.assertFalse(node.has_jump())
-
-    def test_has_jump_true(self):
-        """Test has_jump returns True when jump capability exists."""
-        target_node = self.create_node()
-        jump_node = self.create_jump_node(target_node)
-        self.assertTrue(jump_node.has_jump())
-
-    def test_is_terminal_true(self):
-        """Test is_terminal returns True for terminal nodes."""
-        node = self.create_node()
-        # No next_zone, no jump_zone
-        self.assertTrue(node.is_terminal())
-
-    def test_is_terminal_false_has_next(self):
-        """Test is_terminal returns False when node has next_zone."""
-        next_node = self.create_node()
-        node = self.create_node(next_zone=next_node)
-        self.assertFalse(node.is_terminal())
-
-    def test_is_terminal_false_has_jump(self):
-        """Test is_terminal returns False when node has jump capability."""
-        target_node = self.create_node()
-        jump_node = self.create_jump_node(target_node)
-        self.assertFalse(jump_node.is_terminal())
-
-    def test_is_input_zone(self):
-        """Test is_input_zone reflects input flag."""
-        # Test False
-        node = self.create_node()
-        self.assertFalse(node.is_input_zone())
-
-        # Test True
-        input_node = self.create_node(input=True)
-        self.assertTrue(input_node.is_input_zone())
-
-    def test_is_output_zone(self):
-        """Test is_output_zone reflects output flag."""
-        # Test False
-        node = self.create_node()
-        self.assertFalse(node.is_output_zone())
-
-        # Test True
-        output_node = self.create_node(output=True)
-        self.assertTrue(output_node.is_output_zone())
-
-    def test_has_tool_false(self):
-        """Test has_tool returns False when no tool name."""
-        node = self.create_node()
-        self.assertFalse(node.has_tool())
-
-    def test_has_tool_true(self):
-        """Test has_tool returns True when tool name exists."""
-        tool_node = self.create_node(tool_name='calculator')
-        self.assertTrue(tool_node.has_tool())
+    def test_state_queries(self):
+        """Test each state query against nodes with and without the queried feature."""
+        nodes = {
+            # Queries only read state, so the shared template serves as the default node
+            'plain': self._template_node,
+            # The queries never follow jump_zone, so a sentinel target suffices
+            'jump': self.create_jump_node(object()),
+            'next': self.clone_node(next_zone=self.clone_node()),
+            'input': self.clone_node(input=True),
+            'output': self.clone_node(output=True),
+            'tool': self.clone_node(tool_name='calculator'),
+        }
+        cases = [
+            ('has_jump', 'plain', False),
+            ('has_jump', 'jump', True),
+            ('is_terminal', 'plain', True),  # No next_zone, no jump_zone
+            ('is_terminal', 'next', False),
+            ('is_terminal', 'jump', False),
+            ('is_input_zone', 'plain', False),
+            ('is_input_zone', 'input', True),
+            ('is_output_zone', 'plain', False),
+            ('is_output_zone', 'output', True),
+            ('has_tool', 'plain', False),
+            ('has_tool', 'tool', True),
+        ]
+        for method, node_name, expected in cases:
+            with self.subTest(method=method, node=node_name):
+                self.assertEqual(getattr(nodes[node_name], method)(), expected)
 
 
 class TestRZCPNodeLinkedList(BaseRZCPNodeTest):
@@ -279,9 +338,8 @@ class TestRZCPNodeLinkedList(BaseRZCPNodeTest):
 
     def test_get_last_node_single(self):
         """Test get_last_node with single node returns self."""
-        node = self.create_node()
-        last_node = node.get_last_node()
-        self.assertEqual(last_node, node)
+        node = self._template_node
+        self.assertIs(node.get_last_node(), node)
 
     def test_get_last_node_chain(self):
         """Test get_last_node traverses to end of chain."""
@@ -291,7 +349,7 @@ class TestRZCPNodeLinkedList(BaseRZCPNodeTest):
         # Navigate to get individual nodes
         node1 = head_node
         node2 = head_node.next_zone
-        node3 = head_node.next_zone.next_zone
+        node3 = node2.next_zone
 
         # get_last_node should return node3 from any starting point
         self.assertEqual(node1.get_last_node(), node3)
@@ -301,10 +359,10 @@ class TestRZCPNodeLinkedList(BaseRZCPNodeTest):
     def test_get_last_node_with_loop_cycle(self):
         """Test get_last_node handles loop cycles by taking jump branch."""
         # Create a 4-node structure: entry -> loop_start -> loop_body -> exit
-        entry_node = self.create_node(block=0)
-        loop_start = self.create_node(block=1)
-        loop_body = self.create_node(block=2)
-        exit_node = self.create_node(block=3)
+        entry_node = self.clone_node(block=0)
+        loop_start = self.clone_node(block=1)
+        loop_body = self.clone_node(block=2)
+        exit_node = self.clone_node(block=3)
 
         # Create linear chain: entry -> loop_start -> loop_body -> exit
         entry_node.next_zone = loop_start
@@ -324,8 +382,8 @@ class TestRZCPNodeLinkedList(BaseRZCPNodeTest):
 
     def test_attach_single_source(self):
         """Test attach method connects source node to this node."""
-        target = self.create_node()
-        source = self.create_node(block=1)
+        target = self.clone_node()
+        source = self.clone_node(block=1)
 
         # Attach source to target
         result = target.attach([source])
@@ -338,11 +396,9 @@ class TestRZCPNodeLinkedList(BaseRZCPNodeTest):
 
     def test_attach_multiple_sources(self):
         """Test attach method connects multiple source nodes."""
-        target = self.create_node()
+        target = self.clone_node()
 
-        sources = []
-        for i in range(3):
-            sources.append(self.create_node(block=i + 1))
+        sources = [self.clone_node(block=i + 1) for i in range(3)]
 
         # Attach all sources to target
         result = target.attach(sources)
@@ -381,20 +437,20 @@ class TestRZCPNodeBasicLowering(BaseRZCPNodeTest):
         self.assertEqual(result.text, "resolved text")
 
         # Verify sampling callback was called with empty resources
-        self.mock_sampling_callback.assert_called_once_with({})
+        self.assertEqual(self.sampling_callback.calls, [{}])
 
     def test_lower_node_with_dynamic_resources(self):
         """Test lower() passes resources to sampling callback."""
         node = self.create_node()
 
         # Create resources
-        dynamic_mock = Mock(spec=AbstractResource)
-        resources = {'dynamic_res': dynamic_mock}
+        dynamic_resource = _RESOURCES['dynamic']
+        resources = {'dynamic_res': dynamic_resource}
 
         result = node.lower(resources=resources)
 
         # Verify sampling callback was called with resources
-        self.mock_sampling_callback.assert_called_once_with(resources)
+        self.assertEqual(self.sampling_callback.calls, [resources])
 
         # Verify result
         self.assertEqual(result.text, "resolved text")
@@ -441,15 +497,26 @@ class TestRZCPNodeBasicLowering(BaseRZCPNodeTest):
         # Verify chain structure is preserved
         self.assert_szcp_node_properties(result_head, 'test_sequence', 0)
 
-        self.assertIsNotNone(result_head.next_zone)
-        self.assert_szcp_node_properties(result_head.next_zone, 'test_sequence', 1)
+        result_second = result_head.next_zone
+        self.assertIsNotNone(result_second)
+        self.assert_szcp_node_properties(result_second, 'test_sequence', 1)
 
-        self.assertIsNone(result_head.next_zone.next_zone)
+        self.assertIsNone(result_second.next_zone)
 
         # Verify resolved text from different callbacks
         self.assertEqual(result_head.text, "resolved text 0")
-        self.assertEqual(result_head.next_zone.text, "resolved text 1")
+        self.assertEqual(result_second.text, "resolved text 1")
 
+    def test_lower_chains_of_various_lengths(self):
+        """Test lower() preserves order and termination for chains of several lengths."""
+        for length in (1, 2, 3, 5, 10):
+            with self.subTest(length=length):
+                result = self.create_node_chain(length).lower(resources={})
+
+                chain = self.assert_szcp_chain(result, list(range(length)))
+                self.assertIsNone(chain[-1].next_zone)
+                self.assertEqual([node.text for node in chain],
+                                 [f"resolved text {i}" for i in range(length)])
 
 
 class TestRZCPNodeResourceSystem(BaseRZCPNodeTest):
@@ -461,22 +528,22 @@ class TestRZCPNodeResourceSystem(BaseRZCPNodeTest):
 
         # Create multiple resources
         resources = {
-            'resource1': Mock(spec=AbstractResource),
-            'resource2': Mock(spec=AbstractResource),
-            'resource3': Mock(spec=AbstractResource)
+            'resource1': _RESOURCES['resource1'],
+            'resource2': _RESOURCES['resource2'],
+            'resource3': _RESOURCES['resource3']
         }
 
         result = node.lower(resources=resources)
 
         # Verify all resources were passed
-        self.mock_sampling_callback.assert_called_once_with(resources)
+        self.assertEqual(self.sampling_callback.calls, [resources])
 
     def test_lower_chain_with_different_resources(self):
         """Test lowering chain where each node gets same resources."""
         # Create two-node chain
         head_node = self.create_node_chain(2)
 
-        resources = {'shared_resource': Mock(spec=AbstractResource)}
+        resources = {'shared_resource': _RESOURCES['shared_resource']}
 
         # Lower the chain - all nodes should get same resources
         result = head_node.lower(resources=resources)
@@ -485,27 +552,27 @@ class TestRZCPNodeResourceSystem(BaseRZCPNodeTest):
         head_callback = head_node.sampling_callback
         second_callback = head_node.next_zone.sampling_callback
 
-        head_callback.assert_called_once_with(resources)
-        second_callback.assert_called_once_with(resources)
+        self.assertEqual(head_callback.calls, [resources])
+        self.assertEqual(second_callback.calls, [resources])
 
     def test_sampling_callback_signature_compatibility(self):
         """Test that sampling callback signature is correct for three-tier system."""
         node = self.create_node()
 
-        # Create a more realistic callback mock
-        realistic_callback = Mock()
-        realistic_callback.return_value = "realistic result"
+        # Create a more realistic callback
+        realistic_callback = FakeSamplingCallback("realistic result")
         node.sampling_callback = realistic_callback
 
         # Test with empty resources
         result1 = node.lower(resources={})
-        realistic_callback.assert_called_with({})
+        self.assertEqual(realistic_callback.calls, [{}])
+        self.assertEqual(result1.text, "realistic result")
 
-        # Reset mock and test with actual resources
-        realistic_callback.reset_mock()
-        resources = {'test': Mock(spec=AbstractResource)}
+        # Test with actual resources; each lower() is a separate call
+        resources = {'test': _RESOURCES['test']}
         result2 = node.lower(resources=resources)
-        realistic_callback.assert_called_with(resources)
+        self.assertEqual(realistic_callback.calls, [{}, resources])
+        self.assertEqual(result2.text, "realistic result")
 
 
 class TestRZCPNodeGraphTopology(BaseRZCPNodeTest):
@@ -513,188 +580,144 @@ class TestRZCPNodeGraphTopology(BaseRZCPNodeTest):
 
     def _create_topology_node(self, block: int, **overrides) -> RZCPNode:
         """Helper to create nodes for topology tests with unique callbacks."""
-        mock_callback = Mock(return_value=f"text_{block}")
-        overrides.update({'block': block, 'sampling_callback': mock_callback})
-        return self.create_node(**overrides)
+        return self.clone_node(**{
+            **overrides,
+            'block': block,
+            'sampling_callback': FakeSamplingCallback(f"text_{block}")
+        })
+
+    def _build_topology(self,
+                        count: int,
+                        next_edges: Dict[int, int],
+                        jump_edges: Optional[Dict[int, int]] = None) -> List[RZCPNode]:
+        """
+        Helper to build a topology test graph from edge maps.
+
+        Args:
+            count: Number of nodes to create, with blocks 0..count-1
+            next_edges: Mapping of source block to its next_zone block
+            jump_edges: Mapping of source block to its jump_zone block
+
+        Returns:
+            The nodes, indexed by block
+        """
+        nodes = [self._create_topology_node(block) for block in range(count)]
+        for source, target in next_edges.items():
+            nodes[source].next_zone = nodes[target]
+        for source, target in (jump_edges or {}).items():
+            nodes[source].jump_advance_str = '[Jump]'
+            nodes[source].jump_zone = nodes[target]
+        return nodes
 
     def test_linear_chain_topology(self):
         """Test: A → B → C → Terminal"""
-        # Build the graph
-        nodeA = self._create_topology_node(0)
-        nodeB = self._create_topology_node(1)
-        nodeC = self._create_topology_node(2)
-        terminal = self._create_topology_node(3)
-
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = terminal
+        nodeA, _, _, _ = self._build_topology(4, {0: 1, 1: 2, 2: 3})
 
         # Lower from head
         result = nodeA.lower(resources={})
 
-        # Verify structure preservation
-        self.assertEqual(result.block, 0)  # A
-        self.assertEqual(result.next_zone.block, 1)  # B
-        self.assertEqual(result.next_zone.next_zone.block, 2)  # C
-        self.assertEqual(result.next_zone.next_zone.next_zone.block, 3)  # Terminal
-        self.assertIsNone(result.next_zone.next_zone.next_zone.next_zone)
+        # Verify structure preservation: A → B → C → Terminal
+        chain = self.assert_szcp_chain(result, [0, 1, 2, 3])
+        self.assertIsNone(chain[-1].next_zone)
 
     def test_simple_branch_topology(self):
         """Test: A → B (jump to D), A → B → C → D → Terminal"""
-        # Build the graph
-        nodeA = self._create_topology_node(0)
-        nodeB = self._create_topology_node(1)
-        nodeC = self._create_topology_node(2)
-        nodeD = self._create_topology_node(3)
-        terminal = self._create_topology_node(4)
-
-        # Linear path: A → B → C → D → Terminal
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = nodeD
-        nodeD.next_zone = terminal
-
-        # Jump path: B can jump to D
-        nodeB.jump_advance_str = '[Jump]'
-        nodeB.jump_zone = nodeD
+        # Linear path A → B → C → D → Terminal, and B can jump to D
+        nodeA, _, _, _, _ = self._build_topology(5, {0: 1, 1: 2, 2: 3, 3: 4}, jump_edges={1: 3})
 
         # Lower from head
         result = nodeA.lower(resources={})
 
-        # Verify linear structure preserved
-        self.assertEqual(result.block, 0)  # A
-        self.assertEqual(result.next_zone.block, 1)  # B
-        self.assertEqual(result.next_zone.next_zone.block, 2)  # C
-        self.assertEqual(result.next_zone.next_zone.next_zone.block, 3)  # D
+        # Verify linear structure preserved: A → B → C → D
+        _, nodeB_lowered, _, nodeD_lowered = self.assert_szcp_chain(result, [0, 1, 2, 3])
 
         # Verify jump preserved
-        nodeB_lowered = result.next_zone
         self.assertIsNotNone(nodeB_lowered.jump_advance_str)
         self.assertIsNotNone(nodeB_lowered.jump_zone)
-        self.assertEqual(nodeB_lowered.jump_zone.block, 3)  # Points to D
+        self.assertIs(nodeB_lowered.jump_zone, nodeD_lowered)  # Points to D
 
     def test_simple_loop_topology(self):
         """Test: A → B → C (jump back to B) → Terminal"""
-        # Build the graph
-        nodeA = self._create_topology_node(0)
-        nodeB = self._create_topology_node(1)
-        nodeC = self._create_topology_node(2)
-        terminal = self._create_topology_node(3)
-
-        # Linear path: A → B → C → Terminal
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = terminal
-
-        # Loop: C can jump back to B
-        nodeC.jump_advance_str = '[Jump]'
-        nodeC.jump_zone = nodeB
+        # Linear path A → B → C → Terminal, and C can jump back to B
+        nodeA, _, _, _ = self._build_topology(4, {0: 1, 1: 2, 2: 3}, jump_edges={2: 1})
 
         # Lower from head (tests cycle handling)
         result = nodeA.lower(resources={})
 
-        # Verify structure preserved
-        self.assertEqual(result.block, 0)  # A
-        self.assertEqual(result.next_zone.block, 1)  # B
-        self.assertEqual(result.next_zone.next_zone.block, 2)  # C
+        # Verify structure preserved: A → B → C
+        _, nodeB_lowered, nodeC_lowered = self.assert_szcp_chain(result, [0, 1, 2])
 
-        # Verify loop preserved
-        nodeC_lowered = result.next_zone.next_zone
-        self.assertIsNotNone(nodeC_lowered.jump_zone)
-        self.assertEqual(nodeC_lowered.jump_zone.block, 1)  # Points back to B
-
-        # Verify no infinite recursion occurred (cycle detection worked)
-        nodeB_lowered = result.next_zone
-        self.assertEqual(nodeB_lowered.block, 1)
+        # Verify loop preserved, back to the same lowered B (cycle detection worked)
+        self.assertIs(nodeC_lowered.jump_zone, nodeB_lowered)
 
     def test_convergent_paths_topology(self):
         """Test: A → B → D, A → C → D → Terminal"""
-        # Build the graph with convergence
-        nodeA = self._create_topology_node(0)
-        nodeB = self._create_topology_node(1)
-        nodeC = self._create_topology_node(2)
-        nodeD = self._create_topology_node(3)
-        terminal = self._create_topology_node(4)
-
-        # Path 1: A → B → D
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeD
-
-        # Path 2: A can also jump to C, C → D
-        nodeA.jump_advance_str = '[Jump]'
-        nodeA.jump_zone = nodeC
-        nodeC.next_zone = nodeD
-
-        # Continuation: D → Terminal
-        nodeD.next_zone = terminal
+        # A → B → D and C → D → Terminal, and A can jump to C
+        nodeA, _, _, _, _ = self._build_topology(5, {0: 1, 1: 3, 2: 3, 3: 4}, jump_edges={0: 2})
 
         # Lower from head
         result = nodeA.lower(resources={})
 
-        # Verify both paths lead to same D
-        path1_D = result.next_zone.next_zone  # A → B → D
-        path2_D = result.jump_zone.next_zone  # A → C → D
-
-        self.assertEqual(path1_D.block, 3)  # D
-        self.assertEqual(path2_D.block, 3)  # D
+        # Verify both paths lead through D to the terminal
+        path1 = self.assert_szcp_chain(result, [0, 1, 3, 4])  # A → B → D → Terminal
+        path2 = self.assert_szcp_chain(result.jump_zone, [2, 3, 4])  # C → D → Terminal
 
-        # Both should point to same terminal
-        self.assertEqual(path1_D.next_zone.block, 4)  # Terminal
-        self.assertEqual(path2_D.next_zone.block, 4)  # Terminal
+        # Both paths should share the same lowered D
+        self.assertIs(path1[2], path2[1])
 
     def test_cycle_detection_prevents_infinite_recursion(self):
         """Test that lowering with cycles doesn't cause infinite recursion."""
         # Create a cycle: A → B → C → B
-        nodeA = self._create_topology_node(0)
-        nodeB = self._create_topology_node(1)
-        nodeC = self._create_topology_node(2)
-
-        # Create the cycle
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = nodeB  # Cycle back to B
+        nodeA, _, _ = self._build_topology(3, {0: 1, 1: 2, 2: 1})
 
         # This should complete without infinite recursion
         result = nodeA.lower(resources={})
 
-        # Verify the cycle is preserved in lowered graph
-        self.assertEqual(result.block, 0)  # A
-        self.assertEqual(result.next_zone.block, 1)  # B
-        self.assertEqual(result.next_zone.next_zone.block, 2)  # C
-        self.assertEqual(result.next_zone.next_zone.next_zone.block, 1)  # Back to B
+        # Verify the cycle is preserved in lowered graph: A → B → C → back to B
+        _, nodeB_lowered, _, nodeB_from_cycle = self.assert_szcp_chain(result, [0, 1, 2, 1])
 
         # Verify they're the same instance (proper cycle detection)
-        nodeB_lowered = result.next_zone
-        nodeB_from_cycle = result.next_zone.next_zone.next_zone
-        self.assertEqual(nodeB_lowered, nodeB_from_cycle)
+        self.assertIs(nodeB_lowered, nodeB_from_cycle)
+
+    def test_shared_lowered_map_across_lower_calls(self):
+        """Test: A → C, B → C lowered separately through one lowered_map"""
+        nodeA, nodeB, nodeC = self._build_topology(3, {0: 2, 1: 2})
+
+        # Lower both heads, sharing the map between the two calls
+        lowered_map = {}
+        resultA = nodeA.lower(resources={}, lowered_map=lowered_map)
+        resultB = nodeB.lower(resources={}, lowered_map=lowered_map)
+
+        # C was lowered once, by the first call, and reused by the second
+        self.assertIs(resultA.next_zone, resultB.next_zone)
+        self.assertIs(lowered_map[nodeC], resultA.next_zone)
+        self.assertEqual(len(nodeC.sampling_callback.calls), 1)
+
+        # Lowering an already-mapped node returns the mapped result directly
+        self.assertIs(nodeA.lower(resources={}, lowered_map=lowered_map), resultA)
+        self.assertEqual(len(nodeA.sampling_callback.calls), 1)
 
     def test_topology_with_dynamic_resources(self):
         """Test complex topology with resources passed through."""
-        # Create a complex graph: A → B (jump to D), C → D → Terminal
-        nodeA = self._create_topology_node(0)
-        nodeB = self._create_topology_node(1)
-        nodeC = self._create_topology_node(2)
-        nodeD = self._create_topology_node(3)
-
-        # Build topology
-        nodeA.next_zone = nodeB
-        nodeB.jump_advance_str = '[Jump]'
-        nodeB.jump_zone = nodeD
-        nodeC.next_zone = nodeD
+        # Create a complex graph: A → B (jump to D), C → D
+        nodeA, nodeB, nodeC, nodeD = self._build_topology(4, {0: 1, 2: 3}, jump_edges={1: 3})
 
         # Create resources
         resources = {
-            'shared_resource': Mock(spec=AbstractResource),
-            'topology_resource': Mock(spec=AbstractResource)
+            'shared_resource': _RESOURCES['shared_resource'],
+            'topology_resource': _RESOURCES['topology_resource']
         }
 
         # Lower from head
         result = nodeA.lower(resources=resources)
 
-        # Verify all callbacks were called with same resources
-        nodeA.sampling_callback.assert_called_with(resources)
-        nodeB.sampling_callback.assert_called_with(resources)
-        nodeD.sampling_callback.assert_called_with(resources)
+        # Verify each reachable callback was called once with the same resources
+        self.assertEqual(nodeA.sampling_callback.calls, [resources])
+        self.assertEqual(nodeB.sampling_callback.calls, [resources])
+        self.assertEqual(nodeD.sampling_callback.calls, [resources])
+
+        # C is not reachable from A, so it is never sampled
+        self.assertEqual(nodeC.sampling_callback.calls, [])
 
 
 class TestRZCPNodeErrorHandling(BaseRZCPNodeTest):
@@ -713,7 +736,7 @@ class TestRZCPNodeErrorHandling(BaseRZCPNodeTest):
 
     def test_sampling_callback_failure(self):
         """Test error handling when sampling callback fails."""
-        failing_callback = Mock(side_effect=RuntimeError("Sampling failed"))
+        failing_callback = FakeSamplingCallback(error=RuntimeError("Sampling failed"))
         node = self.create_node(
             sequence='error_sequence',
             block=5,
@@ -723,14 +746,13 @@ class TestRZCPNodeErrorHandling(BaseRZCPNodeTest):
         with self.assertRaises(GraphLoweringError) as context:
             node.lower(resources={})
 
-        self.assertEqual(context.exception.sequence, "error_sequence")
-        self.assertEqual(context.exception.block, 5)
+        self.assert_graph_error_context(context, "error_sequence", 5)
         self.assertIsInstance(context.exception.__cause__, RuntimeError)
 
     def test_lower_chain_error_propagation(self):
         """Test error propagation when lowering chains."""
         # Create chain where second node will fail
-        failing_callback = Mock(side_effect=RuntimeError("Node2 failed"))
+        failing_callback = FakeSamplingCallback(error=RuntimeError("Node2 failed"))
 
         node1 = self.create_node(sequence='error_sequence', block=5)
         node2 = self.create_node(
@@ -745,30 +767,28 @@ class TestRZCPNodeErrorHandling(BaseRZCPNodeTest):
             node1.lower(resources={})
 
         # Error should reference the failing node's context
-        self.assertEqual(context.exception.sequence, "error_sequence")
-        self.assertEqual(context.exception.block, 6)  # Should be node2's block
+        self.assert_graph_error_context(context, "error_sequence", 6)  # node2's block
 
     def test_sampling_callback_error_with_resources(self):
         """Test error handling when sampling callback fails with resources."""
-        failing_callback = Mock(side_effect=ValueError("Resource error"))
+        failing_callback = FakeSamplingCallback(error=ValueError("Resource error"))
         node = self.create_node(
             sequence='resource_error_sequence',
             block=7,
             sampling_callback=failing_callback
         )
 
-        resources = {'failing_resource': Mock(spec=AbstractResource)}
+        resources = {'failing_resource': _RESOURCES['failing_resource']}
 
         with self.assertRaises(GraphLoweringError) as context:
             node.lower(resources=resources)
 
         # Verify error context
-        self.assertEqual(context.exception.sequence, "resource_error_sequence")
-        self.assertEqual(context.exception.block, 7)
+        self.assert_graph_error_context(context, "resource_error_sequence", 7)
         self.assertIsInstance(context.exception.__cause__, ValueError)
 
         # Verify callback was called with resources before failing
-        failing_callback.assert_called_once_with(resources)
+        self.assertEqual(failing_callback.calls, [resources])
 
 
 if __name__ == "__main__":
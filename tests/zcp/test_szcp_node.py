@@ -11,16 +11,90 @@ Tests cover:
 7. Serialization and deserialization functionality
 """
 
+import functools
 import unittest
+from types import MappingProxyType
 import numpy as np
 import msgpack
-from unittest.mock import Mock
-from typing import Dict, Any
+from unittest.mock import Mock, patch
+from typing import Dict, Any, List, Optional
 
 # Import the modules under test
 from workflow_forge.zcp.nodes import SZCPNode, LZCPNode, GraphLoweringError
-from workflow_forge.zcp.tag_converter import TagConverter
-from workflow_forge.tokenizer_interface import TokenizerInterface
+
+# Constructor arguments shared by every test node. Frozen so no test can
+# mutate it; tags is a tuple here and is copied into a fresh list for each node.
+_BASE_NODE_DATA = MappingProxyType({
+    'sequence': 'test_sequence',
+    'block': 0,
+    'text': 'Test resolved text',
+    'zone_advance_str': '[Answer]',
+    'escape_strs': ('[Escape]', '[EndEscape]'),
+    'tags': ('Training',),
+    'timeout': 1000,
+    'input': False,
+    'output': False,
+    'next_zone': None,
+    'jump_advance_str': None,
+    'jump_zone': None,
+    'tool_name': None
+})
+
+
+def _make_node_data(**overrides) -> Dict[str, Any]:
+    """Build SZCPNode constructor arguments from the base data, with a fresh tags list."""
+    return {**_BASE_NODE_DATA, 'tags': list(_BASE_NODE_DATA['tags']), **overrides}
+
+
+@functools.lru_cache(maxsize=None)
+def _fake_tokens(text: str) -> np.ndarray:
+    """Deterministic one-token array for a text, shared read-only between calls."""
+    tokens = np.array([hash(text) % 1000], dtype=np.int32)
+    tokens.setflags(write=False)
+    return tokens
+
+
+@functools.lru_cache(maxsize=None)
+def _fake_tags(num_tags: int) -> np.ndarray:
+    """All-active tag array of the given length, shared read-only between calls."""
+    tags = np.ones(num_tags, dtype=np.bool_)
+    tags.setflags(write=False)
+    return tags
+
+
+class FakeTokenizer:
+    """
+    Lightweight stand-in for a tokenizer. Maps each text to a one-token
+    array, or raises a given error, and records the set of texts it was
+    called with; tests only ever check membership, not order.
+    """
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+        self.calls = set()
+
+    def tokenize(self, text: str) -> np.ndarray:
+        self.calls.add(text)
+        if self.error is not None:
+            raise self.error
+        return _fake_tokens(text)
+
+
+class FakeTagConverter:
+    """
+    Lightweight stand-in for a tag converter. Marks every tag as active,
+    or raises a given error, and records the tags it was called with.
+    """
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+        self.calls = []
+
+    def tensorize(self, tags: List[str]) -> np.ndarray:
+        self.calls.append(tags)
+        if self.error is not None:
+            raise self.error
+        return _fake_tags(len(tags))
 
 
 class BaseSZCPNodeTest(unittest.TestCase):
@@ -28,15 +102,9 @@ class BaseSZCPNodeTest(unittest.TestCase):
 
     def setUp(self):
         """Set up common test fixtures."""
-        # Create mock tokenizer
-        self.mock_tokenizer = Mock(spec=TokenizerInterface)
-        self.mock_tokenizer.tokenize = Mock()
-        self.mock_tokenizer.tokenize.side_effect = lambda text: np.array([hash(text) % 1000], dtype=np.int32)
-
-        # Create mock tag converter
-        self.mock_tag_converter = Mock(spec=TagConverter)
-        self.mock_tag_converter.tensorize = Mock()
-        self.mock_tag_converter.tensorize.side_effect = lambda tags: np.array([True] * len(tags), dtype=np.bool_)
+        # Create fake tokenizer and tag converter
+        self.tokenizer = FakeTokenizer()
+        self.tag_converter = FakeTagConverter()
 
         # Create mock tool registry
         self.mock_tool_callback = Mock()
@@ -53,23 +121,7 @@ class BaseSZCPNodeTest(unittest.TestCase):
         Returns:
             Dictionary of valid SZCPNode constructor arguments
         """
-        base_data = {
-            'sequence': 'test_sequence',
-            'block': 0,
-            'text': 'Test resolved text',
-            'zone_advance_str': '[Answer]',
-            'escape_strs': ('[Escape]', '[EndEscape]'),
-            'tags': ['Training'],
-            'timeout': 1000,
-            'input': False,
-            'output': False,
-            'next_zone': None,
-            'jump_advance_str': None,
-            'jump_zone': None,
-            'tool_name': None
-        }
-        base_data.update(overrides)
-        return base_data
+        return _make_node_data(**overrides)
 
     def create_node(self, **overrides) -> SZCPNode:
         """
@@ -98,12 +150,10 @@ class BaseSZCPNodeTest(unittest.TestCase):
             raise ValueError("Chain length must be at least 1")
 
         # Create nodes
-        nodes = []
-        for i in range(length):
-            node_overrides = base_overrides.copy()
-            node_overrides.update({'block': i, 'text': f'Test text {i}'})
-            node = self.create_node(**node_overrides)
-            nodes.append(node)
+        nodes = [
+            self.create_node(**{**base_overrides, 'block': i, 'text': f'Test text {i}'})
+            for i in range(length)
+        ]
 
         # Link them
         for i in range(length - 1):
@@ -123,17 +173,11 @@ class BaseSZCPNodeTest(unittest.TestCase):
         Returns:
             SZCPNode with jump capability configured
         """
-        jump_overrides = {
-            'jump_advance_str': jump_str,
-            'jump_zone': target_node
-        }
-        jump_overrides.update(overrides)
-        return self.create_node(**jump_overrides)
+        return self.create_node(**{'jump_advance_str': jump_str, 'jump_zone': target_node, **overrides})
 
     def create_topology_node(self, block: int, **overrides) -> SZCPNode:
         """Helper to create nodes for topology tests with unique text."""
-        overrides.update({'block': block, 'text': f'text_{block}'})
-        return self.create_node(**overrides)
+        return self.create_node(**{**overrides, 'block': block, 'text': f'text_{block}'})
 
     def assert_lzcp_node_properties(self, lzcp_node: LZCPNode, expected_sequence: str,
                                   expected_block: int, expected_timeout: int = 1000):
@@ -360,7 +404,7 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
         """Test lower creates valid LZCPNode."""
         node = self.create_node()
 
-        result = node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify result using helper assertion
         self.assert_lzcp_node_properties(result, 'test_sequence', 0)
@@ -374,11 +418,11 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
         self.assertIsNone(result.tool_callback)
 
         # Verify tokenizer was called
-        self.mock_tokenizer.tokenize.assert_any_call('Test resolved text')
-        self.mock_tokenizer.tokenize.assert_any_call('[Answer]')
+        self.assertIn('Test resolved text', self.tokenizer.calls)
+        self.assertIn('[Answer]', self.tokenizer.calls)
 
         # Verify tag converter was called
-        self.mock_tag_converter.tensorize.assert_called_with(['Training'])
+        self.assertEqual(self.tag_converter.calls[-1], ['Training'])
 
     def test_lower_node_field_preservation(self):
         """Test that all fields are properly preserved during lowering."""
@@ -388,7 +432,7 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
             tool_name='calculator'
         )
 
-        result = node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify flags preserved
         self.assertTrue(result.input)
@@ -398,7 +442,7 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
     def test_lower_single_node(self):
         """Test lower() method with single node."""
         node = self.create_node()
-        result = node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Should return LZCPNode
         self.assertIsInstance(result, LZCPNode)
@@ -411,7 +455,7 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
         head_node = self.create_node_chain(2)
 
         # Lower the chain
-        result_head = head_node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result_head = head_node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify chain structure is preserved
         self.assert_lzcp_node_properties(result_head, 'test_sequence', 0)
@@ -426,7 +470,7 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
         target_node = self.create_node()
         jump_node = self.create_jump_node(target_node)
 
-        result = jump_node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = jump_node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify jump tokens were tokenized and preserved
         self.assertIsNotNone(result.jump_tokens)
@@ -434,12 +478,12 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
         self.assertIsInstance(result.jump_zone, LZCPNode)
 
         # Verify jump string was tokenized
-        self.mock_tokenizer.tokenize.assert_any_call('[Jump]')
+        self.assertIn('[Jump]', self.tokenizer.calls)
 
     def test_lower_with_tool(self):
         """Test lower() preserves tool information."""
         tool_node = self.create_node(tool_name='calculator')
-        result = tool_node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = tool_node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify tool callback preserved
         self.assertEqual(result.tool_callback, self.mock_tool_callback)
@@ -449,7 +493,7 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
         node = self.create_node(tool_name='missing_tool')
 
         with self.assertRaises(GraphLoweringError) as context:
-            node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+            node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         self.assertEqual(context.exception.sequence, 'test_sequence')
         self.assertEqual(context.exception.block, 0)
@@ -458,20 +502,35 @@ class TestSZCPNodeBasicLowering(BaseSZCPNodeTest):
 class TestSZCPNodeGraphTopology(BaseSZCPNodeTest):
     """Test graph topology lowering - the mathematical DCG-IO focus."""
 
+    def _build_topology(self,
+                        count: int,
+                        next_edges: Dict[int, int],
+                        jump_edges: Optional[Dict[int, int]] = None) -> List[SZCPNode]:
+        """
+        Helper to build a topology test graph from edge maps.
+
+        Args:
+            count: Number of nodes to create, with blocks 0..count-1
+            next_edges: Mapping of source block to its next_zone block
+            jump_edges: Mapping of source block to its jump_zone block
+
+        Returns:
+            The nodes, indexed by block
+        """
+        nodes = [self.create_topology_node(block) for block in range(count)]
+        for source, target in next_edges.items():
+            nodes[source].next_zone = nodes[target]
+        for source, target in (jump_edges or {}).items():
+            nodes[source].jump_advance_str = '[Jump]'
+            nodes[source].jump_zone = nodes[target]
+        return nodes
+
     def test_linear_chain_topology(self):
         """Test: A → B → C → Terminal"""
-        # Build the graph
-        nodeA = self.create_topology_node(0)
-        nodeB = self.create_topology_node(1)
-        nodeC = self.create_topology_node(2)
-        terminal = self.create_topology_node(3)
-
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = terminal
+        nodeA, _, _, _ = self._build_topology(4, {0: 1, 1: 2, 2: 3})
 
         # Lower from head
-        result = nodeA.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = nodeA.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify structure preservation
         self.assertEqual(result.block, 0)  # A
@@ -482,25 +541,11 @@ class TestSZCPNodeGraphTopology(BaseSZCPNodeTest):
 
     def test_simple_branch_topology(self):
         """Test: A → B (jump to D), A → B → C → D → Terminal"""
-        # Build the graph
-        nodeA = self.create_topology_node(0)
-        nodeB = self.create_topology_node(1)
-        nodeC = self.create_topology_node(2)
-        nodeD = self.create_topology_node(3)
-        terminal = self.create_topology_node(4)
-
-        # Linear path: A → B → C → D → Terminal
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = nodeD
-        nodeD.next_zone = terminal
-
-        # Jump path: B can jump to D
-        nodeB.jump_advance_str = '[Jump]'
-        nodeB.jump_zone = nodeD
+        # Linear path A → B → C → D → Terminal, and B can jump to D
+        nodeA, _, _, _, _ = self._build_topology(5, {0: 1, 1: 2, 2: 3, 3: 4}, jump_edges={1: 3})
 
         # Lower from head
-        result = nodeA.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = nodeA.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify linear structure preserved
         self.assertEqual(result.block, 0)  # A
@@ -516,23 +561,11 @@ class TestSZCPNodeGraphTopology(BaseSZCPNodeTest):
 
     def test_simple_loop_topology(self):
         """Test: A → B → C (jump back to B) → Terminal"""
-        # Build the graph
-        nodeA = self.create_topology_node(0)
-        nodeB = self.create_topology_node(1)
-        nodeC = self.create_topology_node(2)
-        terminal = self.create_topology_node(3)
-
-        # Linear path: A → B → C → Terminal
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = terminal
-
-        # Loop: C can jump back to B
-        nodeC.jump_advance_str = '[Jump]'
-        nodeC.jump_zone = nodeB
+        # Linear path A → B → C → Terminal, and C can jump back to B
+        nodeA, _, _, _ = self._build_topology(4, {0: 1, 1: 2, 2: 3}, jump_edges={2: 1})
 
         # Lower from head (tests cycle handling)
-        result = nodeA.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = nodeA.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify structure preserved
         self.assertEqual(result.block, 0)  # A
@@ -550,27 +583,11 @@ class TestSZCPNodeGraphTopology(BaseSZCPNodeTest):
 
     def test_convergent_paths_topology(self):
         """Test: A → B → D, A → C → D → Terminal"""
-        # Build the graph with convergence
-        nodeA = self.create_topology_node(0)
-        nodeB = self.create_topology_node(1)
-        nodeC = self.create_topology_node(2)
-        nodeD = self.create_topology_node(3)
-        terminal = self.create_topology_node(4)
-
-        # Path 1: A → B → D
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeD
-
-        # Path 2: A can also jump to C, C → D
-        nodeA.jump_advance_str = '[Jump]'
-        nodeA.jump_zone = nodeC
-        nodeC.next_zone = nodeD
-
-        # Continuation: D → Terminal
-        nodeD.next_zone = terminal
+        # A → B → D and C → D → Terminal, and A can jump to C
+        nodeA, _, _, _, _ = self._build_topology(5, {0: 1, 1: 3, 2: 3, 3: 4}, jump_edges={0: 2})
 
         # Lower from head
-        result = nodeA.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = nodeA.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify both paths lead to same D
         path1_D = result.next_zone.next_zone  # A → B → D
@@ -586,17 +603,10 @@ class TestSZCPNodeGraphTopology(BaseSZCPNodeTest):
     def test_cycle_detection_prevents_infinite_recursion(self):
         """Test that lowering with cycles doesn't cause infinite recursion."""
         # Create a cycle: A → B → C → B
-        nodeA = self.create_topology_node(0)
-        nodeB = self.create_topology_node(1)
-        nodeC = self.create_topology_node(2)
-
-        # Create the cycle
-        nodeA.next_zone = nodeB
-        nodeB.next_zone = nodeC
-        nodeC.next_zone = nodeB  # Cycle back to B
+        nodeA, _, _ = self._build_topology(3, {0: 1, 1: 2, 2: 1})
 
         # This should complete without infinite recursion
-        result = nodeA.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+        result = nodeA.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Verify the cycle is preserved in lowered graph
         self.assertEqual(result.block, 0)  # A
@@ -616,12 +626,12 @@ class TestSZCPNodeErrorHandling(BaseSZCPNodeTest):
     def test_lower_error_propagation(self):
         """Test error propagation when lowering fails."""
         # Make tokenizer fail
-        self.mock_tokenizer.tokenize.side_effect = RuntimeError("Tokenization failed")
+        self.tokenizer.error = RuntimeError("Tokenization failed")
 
         node = self.create_node(sequence='error_sequence', block=5)
 
         with self.assertRaises(GraphLoweringError) as context:
-            node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+            node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         self.assertEqual(context.exception.sequence, "error_sequence")
         self.assertEqual(context.exception.block, 5)
@@ -630,12 +640,12 @@ class TestSZCPNodeErrorHandling(BaseSZCPNodeTest):
         """Test that original exceptions are preserved in the chain."""
         # Make tag converter fail
         original_error = ValueError("Tag conversion failed")
-        self.mock_tag_converter.tensorize.side_effect = original_error
+        self.tag_converter.error = original_error
 
         node = self.create_node(sequence='error_sequence', block=5)
 
         with self.assertRaises(GraphLoweringError) as context:
-            node.lower(self.mock_tokenizer, self.mock_tag_converter, self.tool_registry)
+            node.lower(self.tokenizer, self.tag_converter, self.tool_registry)
 
         # Check that original exception is chained
         self.assertIsInstance(context.exception.__cause__, ValueError)
@@ -946,5 +956,28 @@ class TestSZCPSerialization(BaseSZCPNodeTest):
         self.assertEqual(deserialized.next_zone.block, 1)
         self.assertIsNone(deserialized.next_zone.next_zone)
 
+
+class TestSZCPNodeVisualization(BaseSZCPNodeTest):
+    """Test how visualize() hands the figure off."""
+
+    def test_visualize_png_writes_static_image(self):
+        """Test that .png targets are exported with write_image, not as html."""
+        mock_fig = Mock()
+        with patch("workflow_forge.zcp.nodes.create_plotly_graph", return_value=mock_fig):
+            self.create_node_chain(2).visualize(save_to_file="graph.png")
+
+        mock_fig.write_image.assert_called_once_with("graph.png")
+        mock_fig.write_html.assert_not_called()
+        mock_fig.show.assert_not_called()
+
+    def test_visualize_other_names_write_html(self):
+        """Test that non-png targets are still saved as html."""
+        mock_fig = Mock()
+        with patch("workflow_forge.zcp.nodes.create_plotly_graph", return_value=mock_fig):
+            self.create_node_chain(2).visualize(save_to_file="graph")
+
+        mock_fig.write_html.assert_called_once_with("graph.html")
+        mock_fig.write_image.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file